@@ -1,17 +1,15 @@
 import os
 import importlib
-import inspect
+import pkgutil
 from barfi import Block
 import gen_block
 
-# Get a list of all Python files in the current directory
-files = [f[:-3] for f in os.listdir(os.path.dirname(__file__)) if f.endswith('.py') and f != '__init__.py']
-
-# Dynamically import modules and collect Block instances
+# Dynamically import modules and collect Block instances. The package body runs once
+# per process, so the discovery needs no cache of its own.
 blocks = []
-for file_ in files:
-    module = importlib.import_module('.' + file_, package=__name__)
-    for name, obj in inspect.getmembers(module):
+for module_info in pkgutil.iter_modules([os.path.dirname(__file__)]):
+    module = importlib.import_module("." + module_info.name, package=__name__)
+    for obj in vars(module).values():
         if isinstance(obj, Block):
             blocks.append(obj)
 
@@ -3,40 +3,39 @@ import streamlit as st
 
 
 def slider_params(config_str=None, params_str=None):
-    if config_str is None or len(config_str) == 0:
-        output = st.session_state["slider_params"]
-    else:
-        if params_str is None or len(params_str) == 0:
-            output = st.session_state["slider_params"][config_str]
-        else:
-            output = st.session_state["slider_params"][config_str][params_str]
+    output = st.session_state["slider_params"]
+    if config_str:
+        output = output[config_str]
+        if params_str:
+            output = output[params_str]
     return output
 
 
 def storage(data, id_str, overwrite, unique):
-    if "storage" not in st.session_state:
-        st.session_state["storage"] = dict()
-    if data.__class__.__name__ not in st.session_state["storage"]:
-        st.session_state["storage"][data.__class__.__name__] = dict()
+    cls_name = type(data).__name__
+    store = st.session_state.setdefault("storage", dict()).setdefault(cls_name, dict())
     if len(id_str) > 0:
         init_name = id_str
     else:
         if unique:
-            init_name = f"{data.__class__.__name__}_{id(data)}"
+            init_name = f"{cls_name}_{id(data)}"
         else:
-            init_name = f"{data.__class__.__name__}"
-    keys_ids_str = [
-        i
-        for i in st.session_state["storage"][data.__class__.__name__].keys()
-        if i.startswith(init_name)
-    ]
-    if len(keys_ids_str) > 0 and not overwrite:
-        num = max([int(i.split("-")[-1]) for i in keys_ids_str]) + 1
-        data_name = f"{init_name}-{num}"
+            init_name = cls_name
+    # Last used index per (type, name) so we don't rescan the stored keys.
+    # Entries can also be written directly (e.g. from the Python editor), so skip
+    # past any name that is already taken instead of overwriting it.
+    counters = st.session_state.setdefault("_storage_counters", dict())
+    counter_key = (cls_name, init_name)
+    if overwrite:
+        num = 1
     else:
-        data_name = f"{init_name}-1"
+        num = counters.get(counter_key, 0) + 1
+        while f"{init_name}-{num}" in store:
+            num += 1
+    counters[counter_key] = max(counters.get(counter_key, 0), num)
+    data_name = f"{init_name}-{num}"
 
-    st.session_state["storage"][data.__class__.__name__][data_name] = data
+    store[data_name] = data
 
 
 option_config_slider_params = {
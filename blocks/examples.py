@@ -1,7 +1,6 @@
 from gen_block import generate_block
 import random
 import time
-import matplotlib.pyplot as plt
 
 
 def compute_test_func(input1, input2):
@@ -97,6 +96,7 @@ block5 = generate_block(
 
 def dataframe(param):
     import pandas as pd
+    import matplotlib.pyplot as plt
 
     data = pd.DataFrame(
         {
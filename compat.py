@@ -0,0 +1,9 @@
+import streamlit as st
+
+# st.fragment needs Streamlit >= 1.37; 1.33-1.36 ship it as st.experimental_fragment.
+# On older versions functions decorated with it run inline and the whole app reruns.
+fragment = (
+    getattr(st, "fragment", None)
+    or getattr(st, "experimental_fragment", None)
+    or (lambda func: func)
+)
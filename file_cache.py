@@ -0,0 +1,71 @@
+import streamlit as st
+import json
+import glob
+import os
+from typing import Optional
+
+
+@st.cache_data(show_spinner=False)
+def load_json(path: str, mtime: float) -> dict:
+    """
+    Read and parse a JSON file, caching the result across Streamlit reruns.
+
+    Parameters
+    ----------
+    path : str
+        Path to the JSON file.
+    mtime : float
+        Modification time of the file. It is only used as part of the cache key,
+        so editing the file on disk invalidates the cached result.
+
+    Returns
+    -------
+    dict
+        The parsed JSON content. Streamlit returns a fresh copy on every call,
+        so the result can be mutated safely.
+    """
+    with open(path, "r", encoding="UTF-8") as f:
+        return json.loads(f.read())
+
+
+@st.cache_data(show_spinner=False)
+def list_files(pattern: str, root_dir: str, mtime: Optional[float]) -> list:
+    """
+    List the files matching a pattern in a directory, caching the result across reruns.
+
+    Parameters
+    ----------
+    pattern : str
+        Glob pattern, e.g. ``*.json``.
+    root_dir : str
+        Directory to scan.
+    mtime : float or None
+        Modification time of the directory, see ``dir_mtime``. It is only used as part
+        of the cache key. Adding or removing a file updates it, which triggers a fresh scan.
+
+    Returns
+    -------
+    list
+        File names (relative to ``root_dir``) of the matching files.
+    """
+    return glob.glob(pattern, root_dir=root_dir)
+
+
+def dir_mtime(path: str) -> Optional[float]:
+    """
+    Return the modification time of a directory to use as a ``list_files`` cache key.
+
+    Parameters
+    ----------
+    path : str
+        Directory path. An empty path means the current directory.
+
+    Returns
+    -------
+    float or None
+        The modification time, or None if the directory does not exist.
+    """
+    try:
+        return os.path.getmtime(path or os.curdir)
+    except OSError:
+        return None
@@ -1,13 +1,15 @@
 from barfi import Block
 import ast
+import copy
 import inspect
 import json
 import os
 import time
-from typing import Dict, Any
-import numpy as np
+import threading
+from functools import lru_cache
+from collections import OrderedDict
+from typing import Dict, Any, Literal, Tuple, get_args, get_origin
 import streamlit as st
-from joblib import Memory
 
 
 def generate_block(
@@ -16,6 +18,7 @@ def generate_block(
     add_display_option: bool = True,
     category_name: str = "Uncategorized",
     cache: bool = True,
+    cache_backend: Literal["disk", "ram"] = "disk",
 ):
     """
     Generates a Block object configured with inputs, outputs, and options based on a compute function and additional parameters.
@@ -30,6 +33,8 @@ def generate_block(
     - add_display_option (bool, optional): If True, adds a display option to the Block showing the compute function's docstring. Defaults to False.
     - category_name (str, optional): The category name under which the Block will be grouped. Defaults to "Uncategorized".
     - cache (bool, optional): Enables caching of the compute function's results if True. Defaults to False.
+    - cache_backend (str, optional): Where cached results are kept: "disk" uses joblib.Memory in `.cache`,
+      "ram" keeps the most recent results in memory for the lifetime of the process. Defaults to "disk".
 
     Returns:
     - Block: A configured Block object ready for use within a larger application or framework.
@@ -59,7 +64,7 @@ def generate_block(
         return {}
 
     # Get the function signature
-    signature = inspect.signature(compute_func)
+    signature = _get_signature(compute_func)
 
     # Load options config
     try:
@@ -67,15 +72,16 @@ def generate_block(
     except FileNotFoundError:
         options_config = {}
     if isinstance(options_config_param, dict):
-        options_config.update(
-            (k, options_config_param[k]) for k in options_config_param.keys()
-        )
+        options_config.update(options_config_param)
 
     category_name_ = options_config.get("category", category_name)
     if not isinstance(category_name_, str):
         category_name_ = "Uncategorized"
 
     cache_ = options_config.get("cache", cache)
+    cache_backend_ = options_config.get("cache_backend", cache_backend)
+    if cache_backend_ not in ("disk", "ram"):
+        cache_backend_ = "disk"
 
     # Create a Block
     block_name = compute_func.__name__ + "_block"
@@ -85,10 +91,11 @@ def generate_block(
     block.set_state("category", category_name_)
 
     # Add input interfaces
-    input_names_all = {}
-    for param_name, param in signature.parameters.items():
-        input_name = options_config.get("input_names", {}).get(param_name, param_name)
-        input_names_all[param_name] = input_name
+    input_names_config = options_config.get("input_names", {})
+    input_names_all = {
+        param_name: input_names_config.get(param_name, param_name)
+        for param_name in signature.parameters
+    }
 
     optinons_names = options_config.get("options", {})
     input_names_current = {
@@ -121,7 +128,17 @@ def generate_block(
             block.add_option(name="display_line2", type="display", value="-" * 20)
 
     # Add options to the Block
-    add_options(block, compute_func, optinons_names)
+    add_options(block, compute_func, optinons_names, signature=signature)
+
+    # Work that doesn't depend on the Block instance is done once, not per run
+    input_items = tuple(input_names_current.items())
+    option_items = tuple(
+        (opt_name, opt_config.get("name", opt_name))
+        for opt_name, opt_config in optinons_names.items()
+    )
+    spinner_text = f"Running {block_name}"
+    ram_cache = OrderedDict()
+    ram_cache_lock = threading.Lock()
 
     # Define the compute function
     def compute_func_wrapper(self):
@@ -140,23 +157,31 @@ def generate_block(
         """
         # Get the value of the input interfaces
         input_values = {
-            param_name[0]: self.get_interface(name=param_name[1])
-            for param_name in input_names_current.items()
+            param_name: self.get_interface(name=input_name)
+            for param_name, input_name in input_items
         }
         option_values = {
-            opt_name[0]: self.get_option(name=opt_name[1].get("name", opt_name[0]))
-            for opt_name in optinons_names.items()
+            opt_name: self.get_option(name=option_name)
+            for opt_name, option_name in option_items
         }
         cache_ = self.get_option(name="Cache Block")
-        memory = Memory(".cache", verbose=0)
-        with st.spinner(f"Running {block_name}"):
-            start_time = time.time_ns()
-            # Call the provided compute function with input values
-            compute_func_wrapper = (
-                memory.cache(compute_func) if cache_ else compute_func
+        start_time = time.time_ns()
+        # Call the provided compute function with input values
+        if cache_ and cache_backend_ == "ram":
+            outputs = _call_ram_cached(
+                ram_cache,
+                ram_cache_lock,
+                compute_func,
+                {**input_values, **option_values},
+                spinner_text,
             )
-            outputs = compute_func_wrapper(**input_values, **option_values)
-            exec_time = time.time_ns() - start_time
+        else:
+            with st.spinner(spinner_text):
+                compute_func_wrapper = (
+                    _get_memorized(compute_func) if cache_ else compute_func
+                )
+                outputs = compute_func_wrapper(**input_values, **option_values)
+        exec_time = time.time_ns() - start_time
         self.set_state("exec_time", exec_time)
 
         # Set the values of the output interfaces
@@ -170,11 +195,172 @@ def generate_block(
     return block
 
 
+# Shared joblib Memory, created on first use so joblib is only imported when a block caches
+_MEMORY = None
+
+
+@lru_cache(maxsize=None)
+def _get_memorized(func):
+    """
+    Returns the joblib-cached version of a function, creating it only once per function.
+
+    Parameters:
+    - func (function): The function to cache.
+
+    Returns:
+    - joblib.memory.MemorizedFunc: The function wrapped by the shared `.cache` Memory.
+    """
+    global _MEMORY
+    if _MEMORY is None:
+        from joblib import Memory
+
+        _MEMORY = Memory(".cache", verbose=0)
+    return _MEMORY.cache(func)
+
+
+# Number of results kept per block by the "ram" cache backend
+_RAM_CACHE_SIZE = 32
+
+
+def _call_ram_cached(ram_cache, lock, func, kwargs, spinner_text):
+    """
+    Calls a function through a bounded in-memory cache keyed on the joblib hash of its arguments.
+
+    A cache hit returns immediately; the Streamlit spinner is only shown while computing a miss.
+    The cache is shared by all sessions, so like the joblib disk cache every caller gets its own
+    deep copy of the result, and mutating it cannot corrupt the cached value.
+
+    Parameters:
+    - ram_cache (OrderedDict): The block's cache, ordered from least to most recently used.
+    - lock (threading.Lock): Guards `ram_cache` against concurrent sessions.
+    - func (function): The function to call.
+    - kwargs (dict): The keyword arguments for the call.
+    - spinner_text (str): The text shown in the spinner while `func` runs.
+
+    Returns:
+    - Any: A copy of the cached or freshly computed result of `func(**kwargs)`.
+    """
+    from joblib import hash as joblib_hash
+
+    key = joblib_hash(kwargs)
+    with lock:
+        if key in ram_cache:
+            ram_cache.move_to_end(key)
+            return copy.deepcopy(ram_cache[key])
+    # Compute outside the lock so other blocks and sessions are not blocked
+    with st.spinner(spinner_text):
+        outputs = func(**kwargs)
+    with lock:
+        ram_cache[key] = outputs
+        ram_cache.move_to_end(key)
+        if len(ram_cache) > _RAM_CACHE_SIZE:
+            ram_cache.popitem(last=False)
+    return copy.deepcopy(outputs)
+
+
+@lru_cache(maxsize=None)
+def _get_signature(func):
+    """
+    Returns the signature of a function, computing it only once per function.
+
+    Parameters:
+    - func (function): The function to inspect.
+
+    Returns:
+    - inspect.Signature: The cached signature of the function.
+    """
+    return inspect.signature(func)
+
+
+class _ReturnCounter(ast.NodeVisitor):
+    """
+    Finds a function definition by name and counts the values returned by the
+    return statements directly in its body.
+
+    The search stops at the first matching definition and does not descend into
+    function bodies, since nested definitions cannot hold the target's returns.
+    """
+
+    def __init__(self, func_name):
+        self.func_name = func_name
+        self.found = False
+        self.count = 0
+
+    def visit_FunctionDef(self, node):
+        if self.found or node.name != self.func_name:
+            return
+        self.found = True
+        for stmt in node.body:
+            if isinstance(stmt, ast.Return):
+                self.count = _count_returned_values(stmt.value)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node):
+        return
+
+
+def _count_returned_values(value):
+    """
+    Counts the values produced by a return statement's expression.
+
+    Parameters:
+    - value (ast.expr or None): The returned expression.
+
+    Returns:
+    - int: The number of tuple elements, 0 for a bare return or `return None`, otherwise 1.
+    """
+    if isinstance(value, ast.Tuple):
+        return len(value.elts)
+    if value is None or (isinstance(value, ast.Constant) and value.value is None):
+        return 0
+    return 1
+
+
+def _count_annotated_return_values(func):
+    """
+    Counts the values a function returns based on its return annotation.
+
+    Parameters:
+    - func (function): The function to analyze.
+
+    Returns:
+    - int or None: 0 for `-> None`, the number of elements for `-> Tuple[X, Y, ...]`, 1 for a plain
+      class, or None if the count cannot be told from the annotation alone (e.g. `Any`,
+      `Optional[...]`, `Union[...]`).
+    """
+    annotation = _get_signature(func).return_annotation
+    if annotation is inspect.Signature.empty or isinstance(annotation, str):
+        return None
+    if annotation is None or annotation is type(None):
+        return 0
+    if annotation in (tuple, Tuple):
+        return None
+    if get_origin(annotation) is tuple:
+        args = get_args(annotation)
+        if len(args) == 0 or args[-1] is Ellipsis:
+            return None
+        return len(args)
+    # typing.Any is a class on Python 3.11+, but it says nothing about the count
+    if (
+        isinstance(annotation, type)
+        and annotation is not Any
+        and not issubclass(annotation, tuple)
+    ):
+        return 1
+    return None
+
+
+# Return value counts already computed, keyed by the function's code object
+_RETURN_VALUE_COUNTS = {}
+
+
 def find_return_value_count(func):
     """
     Analyzes a function to determine the number of values it returns.
 
-    This function inspects the source code of the given function to count how many values are returned.
+    If the function has a return annotation such as `-> Tuple[X, Y]` or `-> X`, the count is taken from it.
+    Otherwise this function inspects the source code of the given function to count how many values are returned.
     It specifically looks for return statements and evaluates whether the return value is a tuple (multiple values),
     a single value, or None (no value).
 
@@ -185,6 +371,14 @@ def find_return_value_count(func):
     - int: The number of values the function returns. Returns 0 if the function does not return anything or returns None.
 
     """
+    code = getattr(func, "__code__", None)
+    if code in _RETURN_VALUE_COUNTS:
+        return _RETURN_VALUE_COUNTS[code]
+    return_value_count = _count_annotated_return_values(func)
+    if return_value_count is not None:
+        if code is not None:
+            _RETURN_VALUE_COUNTS[code] = return_value_count
+        return return_value_count
     source_lines, _ = inspect.getsourcelines(
         func
     )  # Retrieve the source lines of the function.
@@ -192,34 +386,15 @@ def find_return_value_count(func):
     tree = ast.parse(
         source_code
     )  # Parse the source code into an abstract syntax tree (AST).
-    return_value_count = 0  # Initialize the return value count.
-    for node_ in ast.walk(tree):  # Walk through the AST nodes.
-        if (
-            isinstance(node_, ast.FunctionDef) and func.__name__ == node_.name
-        ):  # Find the function definition node.
-            for node in ast.walk(
-                node_
-            ):  # Walk through the nodes within the function definition.
-                if (
-                    isinstance(node, ast.Return) and node in node_.body
-                ):  # Identify return statements within the function body.
-                    if isinstance(
-                        node.value, ast.Tuple
-                    ):  # If the return value is a tuple, count its elements.
-                        return_value_count = len(node.value.elts)
-                    elif isinstance(
-                        node.value, ast.Constant
-                    ):  # If the return value is a constant, determine if it's None or a single value.
-                        if node.value.value is None:
-                            return_value_count = 0
-                        else:
-                            return_value_count = 1
-                    else:  # For other cases, consider it as a single return value.
-                        return_value_count = 1
+    counter = _ReturnCounter(func.__name__)
+    counter.visit(tree)
+    return_value_count = counter.count
+    if code is not None:
+        _RETURN_VALUE_COUNTS[code] = return_value_count
     return return_value_count  # Return the count of return values.
 
 
-def add_options(block, compute_func, options_config):
+def add_options(block, compute_func, options_config, signature=None):
     """
     Adds options to a Block object based on the configuration provided.
 
@@ -233,11 +408,14 @@ def add_options(block, compute_func, options_config):
       option types if set to 'auto'.
     - options_config (dict): A dictionary where keys are option names and values are dictionaries
       containing option configurations such as type, default value, and other keyword arguments.
+    - signature (inspect.Signature, optional): The already computed signature of the compute function.
+      Defaults to None, in which case it is looked up.
 
     Returns:
     None. The function directly modifies the Block object by adding options to it.
     """
-    signature = inspect.signature(compute_func)
+    if signature is None:
+        signature = _get_signature(compute_func)
     param_names = list(signature.parameters.keys())
     for option_name, option_config_ in options_config.items():
         default_values = {
@@ -255,7 +433,7 @@ def add_options(block, compute_func, options_config):
         }
 
         if option_type == "auto":
-            option_type = infer_option_type(compute_func, option_name)
+            option_type = infer_option_type(compute_func, option_name, signature)
 
         if option_name in param_names:
             option_kwargs["value"] = option_kwargs.get(
@@ -268,26 +446,20 @@ def add_options(block, compute_func, options_config):
             )
 
 
-def infer_option_type(func, param_name):
+@lru_cache(maxsize=1)
+def _get_option_types():
     """
-    Infers the type of an option based on the parameter's annotation in a function.
-
-    This function examines the annotation of a specified parameter in the given function
-    and determines the most appropriate option type for a user interface. It supports
-    distinguishing between numeric types (integers and floats), boolean types, and defaults
-    to a generic input type for all other cases.
+    Builds the table mapping supported annotations to option types.
 
-    Parameters:
-    - func (function): The function whose parameter's type is to be inferred.
-    - param_name (str): The name of the parameter for which the option type is inferred.
+    numpy is imported here rather than at module load since only `infer_option_type` needs its types.
 
     Returns:
-    - str: A string representing the inferred option type. Possible return values include
-      "number" for floating-point types, "integer" for integer types, "checkbox" for boolean
-      types, and "input" for all other types.
-
+    - dict: A dictionary mapping int, bool and float types (Python and numpy) to "integer", "checkbox"
+      and "number" respectively.
     """
-    ints = (
+    import numpy as np
+
+    int_types = (
         int,
         np.int_,
         np.intc,
@@ -310,7 +482,7 @@ def infer_option_type(func, param_name):
         np.longlong,
         np.ulonglong,
     )
-    floats = (
+    float_types = (
         np.float_,
         float,
         np.float16,
@@ -322,16 +494,50 @@ def infer_option_type(func, param_name):
         np.double,
         np.half,
     )
-    signature = inspect.signature(func)
-    param = signature.parameters[param_name]
-    param_type = param.annotation if param.annotation != param.empty else None
-    if any([param_type == type_ for type_ in floats]):
-        return "number"
-    elif any([param_type == type_ for type_ in ints]):
-        return "integer"
-    elif any([param_type == type_ for type_ in (bool, np.bool_)]):
-        return "checkbox"
-    else:
+    bool_types = (bool, np.bool_)
+
+    return {
+        **{type_: "integer" for type_ in int_types},
+        **{type_: "checkbox" for type_ in bool_types},
+        **{type_: "number" for type_ in float_types},
+    }
+
+
+def infer_option_type(func, param_name, signature=None):
+    """
+    Infers the type of an option based on the parameter's annotation in a function.
+
+    This function examines the annotation of a specified parameter in the given function
+    and determines the most appropriate option type for a user interface. It supports
+    distinguishing between numeric types (integers and floats), boolean types, and defaults
+    to a generic input type for all other cases.
+
+    Parameters:
+    - func (function): The function whose parameter's type is to be inferred.
+    - param_name (str): The name of the parameter for which the option type is inferred.
+    - signature (inspect.Signature, optional): The already computed signature of the function.
+      Defaults to None, in which case it is looked up.
+
+    Returns:
+    - str: A string representing the inferred option type. Possible return values include
+      "number" for floating-point types, "integer" for integer types, "checkbox" for boolean
+      types, and "input" for all other types.
+
+    """
+    if signature is None:
+        signature = _get_signature(func)
+    param_type = signature.parameters[param_name].annotation
+    if param_type is inspect.Parameter.empty:
         return "input"
+    try:
+        return _get_option_types().get(param_type, "input")
+    except TypeError:  # unhashable annotation
+        return "input"
+
 
-__all__ = [generate_block]
\ No newline at end of file
+__all__ = [
+    "generate_block",
+    "find_return_value_count",
+    "add_options",
+    "infer_option_type",
+]
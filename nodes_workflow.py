@@ -1,13 +1,15 @@
 import streamlit as st
 import numpy as np
 import json
-import glob
+import os
+import random
 from barfi import st_barfi, barfi_schemas
-from collections import ChainMap
 from blocks import blocks
 import inspect
 from typing import Any, Literal
 from st_pages import show_pages_from_config
+from file_cache import load_json, list_files, dir_mtime
+from compat import fragment
 
 
 # ─────────────────────────────────────
@@ -15,6 +17,11 @@ from st_pages import show_pages_from_config
 # ─────────────────────────────────────
 
 
+# Time units from largest to smallest and their size in nanoseconds
+_TIME_UNITS = ("hr", "min", "s", "ms", "μs", "ns")
+_TIME_DIVISORS = (3_600_000_000_000, 60_000_000_000, 1_000_000_000, 1_000_000, 1_000, 1)
+
+
 def format_nanoseconds(nanoseconds: int) -> str:
     """
     Convert a duration from nanoseconds to a more readable string format, breaking down
@@ -32,33 +39,42 @@ def format_nanoseconds(nanoseconds: int) -> str:
         from the highest non-zero unit down to nanoseconds. For example, "1 hr 15 min 42 s"
         or "200 ms 1 μs". Returns "0 ns" if the input is 0.
     """
-    # Define the units and their conversion factors relative to the next smaller unit.
-    units = {"ns": 0, "μs": 0, "ms": 0, "s": 0, "min": 0, "hr": 0}
-    conversions = [1000, 1000, 1000, 60, 60, 1]  # Conversion factors for each unit.
-    nanoseconds_ = nanoseconds  # Copy of the input to manipulate.
-
-    # Convert nanoseconds to higher units iteratively.
-    for key, conversion in zip(units.keys(), conversions):
-        if key != "hr":  # For all units except hours, calculate quotient and remainder.
-            quotient = nanoseconds_ // conversion
-            remainder = nanoseconds_ % conversion
-            units[key] = remainder  # Assign remainder to the unit.
-            nanoseconds_ = quotient  # Update nanoseconds for the next iteration.
-        else:
-            units[key] = nanoseconds_  # Assign remaining nanoseconds to hours.
-
-    # Reverse the units dictionary to start formatting from the highest unit down.
-    result = list(units.items())[::-1]
-    print_res = "0 ns"  # Default result if all units are zero.
-    # Construct the formatted string with non-zero units.
-    for i, r in enumerate(result):
-        if r[1] != 0:  # If the unit is non-zero, start constructing the result string.
-            print_res = " ".join(
-                [f"{x[1]} {x[0]}" for x in result[i : min(len(result), i + 3)]]
-            )
-            break  # Stop after finding the first non-zero unit.
+    # Split the duration into per-unit amounts, from hours down to nanoseconds.
+    values = []
+    for divisor in _TIME_DIVISORS:
+        value, nanoseconds = divmod(nanoseconds, divisor)
+        values.append(value)
+
+    # Format up to three units, starting from the highest non-zero one.
+    for i, value in enumerate(values):
+        if value != 0:
+            last = min(i + 3, len(values))
+            return " ".join(f"{values[j]} {_TIME_UNITS[j]}" for j in range(i, last))
+    return "0 ns"  # Default result if all units are zero.
+
+
+@st.cache_resource(show_spinner=False)
+def categorize_blocks(include_examples: bool) -> dict:
+    """
+    Group the discovered blocks by their category, caching the result across reruns.
+
+    Parameters
+    ----------
+    include_examples : bool
+        Whether to keep the "Examples" category.
 
-    return print_res
+    Returns
+    -------
+    dict
+        A dictionary mapping category names to lists of blocks, in discovery order.
+    """
+    category_blocks = dict()
+    for block in blocks:
+        category = block._state.get("category", "Uncategorized")
+        category_blocks.setdefault(category, []).append(block)
+    if not include_examples:
+        category_blocks.pop("Examples", None)
+    return category_blocks
 
 
 def display_value(value: Any) -> None:
@@ -84,6 +100,7 @@ def display_value(value: Any) -> None:
     st.write("Type of value:", str(type(value)))  # Display the type of the value
 
 
+@fragment
 def display_block_results(block_result: dict, expanded: bool = False) -> None:
     """
     Display the results of a block computation in the Streamlit app.
@@ -92,7 +109,9 @@ def display_block_results(block_result: dict, expanded: bool = False) -> None:
     details about the block, including its name, status (e.g., computed or errored),
     execution time, inputs, outputs, options, and state. It uses Streamlit components
     to render the information in a user-friendly manner, with sections for inputs,
-    outputs, options, and state information expandable by the user.
+    outputs, options, and state information expandable by the user. The raw block
+    data is only serialized on request, and the function runs as a fragment so
+    toggling it does not rerun the whole app.
 
     Parameters
     ----------
@@ -149,7 +168,8 @@ def display_block_results(block_result: dict, expanded: bool = False) -> None:
         st.write(f"Status: {state_info['status']}")
 
     with st.expander("**Raw data**"):
-        st.json(block_dict)
+        if st.checkbox("Show raw data", key=f"{block_dict['_name']}.show_raw"):
+            st.json(block_dict)
 
 
 # ─────────────────────────────────────
@@ -157,7 +177,31 @@ def display_block_results(block_result: dict, expanded: bool = False) -> None:
 # ─────────────────────────────────────
 
 
-def setup_params() -> dict:
+@st.cache_resource(show_spinner=False)
+def get_widget_param_names(widget_type: str) -> frozenset:
+    """
+    Return the names of the parameters accepted by a Streamlit widget function.
+
+    The result is cached per widget type across reruns because ``inspect.signature``
+    is slow and the signature never changes while the app is running. A module-level
+    cache would not survive, since this script is re-executed on every rerun.
+
+    Parameters
+    ----------
+    widget_type : str
+        Name of the Streamlit widget function (e.g. "slider"). Unknown names fall
+        back to ``st.text_input``.
+
+    Returns
+    -------
+    frozenset
+        The parameter names of the widget function.
+    """
+    widget_func = getattr(st, widget_type, st.text_input)
+    return frozenset(inspect.signature(widget_func).parameters)
+
+
+def setup_params(config_name: str) -> dict:
     """
     Set up and display Streamlit widgets for parameter input based on the current configuration.
 
@@ -170,6 +214,9 @@ def setup_params() -> dict:
     The function returns a dictionary containing these groups, allowing for further manipulation or
     access to the widget values elsewhere in the application.
 
+    Args:
+        config_name (str): Name of the configuration whose parameters are rendered.
+
     Returns:
         dict: A dictionary where keys are parameter group names and values are dictionaries of
               Streamlit widgets created for each parameter in the group. Each widget dictionary
@@ -182,10 +229,7 @@ def setup_params() -> dict:
     # Get the current configuration from the session state
     config = st.session_state["all_params"][config_name]
     default_text = {
-        k: ChainMap(
-            {v: v for v in config["numerical_params"][k]},
-            {"title": k},
-        )
+        k: {"title": k, **{v: v for v in config["numerical_params"][k]}}
         for k in config["numerical_params"]
     }
     # Get the "pretty" text (user-friendly labels) for the numerical parameters
@@ -202,199 +246,262 @@ def setup_params() -> dict:
     ).get(  # Get the "text_params" dictionary, or an empty dict if it doesn't exist
         "help_text", pretty_text
     )  # Get the "help_text" dictionary, or use pretty_text if it doesn't exist
-    with tab:
-        # Iterate over the numerical parameters
-        for name, values in config["numerical_params"].items():
-            # Display the title for the current parameter group
-            st.title(
-                pretty_text.get(name, default_text[name]).get(
-                    "title", default_text[name]["title"]
-                ),
-                help=help_text.get(name, pretty_text.get(name, default_text[name])).get(
-                    "title",
-                    pretty_text.get(name, default_text[name]).get(
-                        "title", default_text[name]["title"]
-                    ),
-                ),
-            )
-
-            # Initialize an empty dictionary to store the widgets for the current parameter group
-            params_widgets = {}
-
-            # Iterate over the individual parameters in the current group
-            for key, value in values.items():
-                # Check if the parameter is the "seed" parameter and if it needs to be set to a specific value
-                if (
-                    name == "generate_params"
-                    and key == "seed"
-                    and st.session_state["random_seed"][config_name]
-                ):
-                    value_ = st.session_state["all_params"][config_name][
-                        "numerical_params"
-                    ]["generate_params"]["seed"]
-                else:
-                    # Otherwise, get the default value from the initial parameters
-                    value_ = st.session_state["all_params_init"][config_name][
-                        "numerical_params"
-                    ][name][key]
-                # Extract the widget type
-                widget_type = value_.get("type", "text_input")
-                # Extract additional widget parameters
-                widget_params = {k: v for k, v in value_.items() if k != "type"}
-
-                # Get the widget function for the parameter type
-                widget_func = getattr(st, widget_type, st.text_input)
-
-                # Filter out any incompatible parameters
-                signature = inspect.signature(widget_func)
-                param_names = list(signature.parameters.keys())
-                widget_params = {
-                    k: v for k, v in widget_params.items() if k in param_names
-                }
-                # Enhanced widget setup based on parameter type
-                if (
-                    "step" in param_names
-                    and st.session_state["multi_params"][config_name]
-                ):
-                    # Setup range widgets (from, to, step)
-                    from_key = f"{config_name}.{name}.{key}.from"
-                    to_key = f"{config_name}.{name}.{key}.to"
-                    step_key = f"{config_name}.{name}.{key}.step"
-
-                    from_value = widget_params.get("value", {})
-                    if isinstance(from_value, dict):
-                        from_value = from_value.get("from", "min")
-                    widget_params_from = dict(widget_params)
-                    widget_params_from.update({"value": from_value})
-
-                    to_value = widget_params.get("value", {})
-                    if isinstance(to_value, dict):
-                        to_value = to_value.get("to", "min")
-                    widget_params_to = dict(widget_params)
-                    widget_params_to.update({"value": to_value})
-
-                    step_value = widget_params.get("step", 0.0)
-                    if isinstance(widget_params.get("value", {}), dict):
-                        step_value = widget_params.get("value", {}).get(
-                            "step", step_value
-                        )
-
-                    widget_params_step = dict(widget_params)
-                    widget_params_step.update({"value": step_value})
-
-                    caption_columms = st.columns(1)
-                    multi_columms = st.columns(3)
-                    with caption_columms[0]:
-                        st.markdown(
-                            pretty_text.get(name, default_text[name]).get(
-                                key, default_text[name][key]
-                            ),
-                            help=help_text.get(
-                                name, pretty_text.get(name, default_text[name])
-                            ).get(
-                                key,
-                                pretty_text.get(name, default_text[name]).get(
-                                    key, default_text[name][key]
-                                ),
-                            ),
-                        )
-                    with multi_columms[0]:
-                        from_w = widget_func(
-                            f"From:",
-                            key=from_key,
-                            **widget_params_from,
-                        )
-                    with multi_columms[1]:
-                        to_w = widget_func(f"To:", key=to_key, **widget_params_to)
-                    with multi_columms[2]:
-                        step_w = widget_func(
-                            f"Step:", key=step_key, **widget_params_step
-                        )
-
-                    params_widgets[key] = {"from": from_w, "to": to_w, "step": step_w}
-                elif (
-                    widget_type == "checkbox"
-                    and st.session_state["multi_params"][config_name]
-                ):
-                    config1_key = f"{config_name}.{name}.{key}.config1"
-                    config2_key = f"{config_name}.{name}.{key}.config2"
-
-                    config1_value = widget_params.get("value", {})
-
-                    if isinstance(config1_value, dict):
-                        config1_value = config1_value.get("config1", True)
-                    widget_params_config1 = dict(widget_params)
-                    widget_params_config1.update({"value": config1_value})
-
-                    config2_value = widget_params.get("value", {})
-                    if isinstance(config2_value, dict):
-                        config2_value = config2_value.get("config2", False)
-                    widget_params_config2 = dict(widget_params)
-                    widget_params_config2.update({"value": config2_value})
-
-                    checkbox_columms = st.columns(2)
-                    with checkbox_columms[0]:
-                        st.markdown("Config 1:")
-                        config1 = widget_func(
-                            f"{pretty_text.get(name, default_text[name]).get(key, default_text[name][key])}:",
-                            key=config1_key,
-                            help=help_text.get(
-                                name, pretty_text.get(name, default_text[name])
-                            ).get(
-                                key,
-                                pretty_text.get(name, default_text[name]).get(
-                                    key, default_text[name][key]
-                                ),
-                            ),
-                            **widget_params_config1,
-                        )
-                    with checkbox_columms[1]:
-                        st.markdown("Config 2:")
-                        config2 = widget_func(
-                            f"{pretty_text.get(name, default_text[name]).get(key, default_text[name][key])}:",
-                            key=config2_key,
-                            help=help_text.get(
-                                name, pretty_text.get(name, default_text[name])
-                            ).get(
-                                key,
-                                pretty_text.get(name, default_text[name]).get(
-                                    key, default_text[name][key]
-                                ),
-                            ),
-                            **widget_params_config2,
-                        )
-                    params_widgets[key] = {
-                        "config1": config1,
-                        "config2": config2,
-                    }
-                else:
-                    # Default widget setup
-                    widget_value = widget_params.get("value", "min")
-                    if isinstance(widget_value, dict):
-                        widget_value = widget_value.get("from", "min")
-                    widget_params_default = dict(widget_params)
-                    widget_params_default.update({"value": widget_value})
-                    params_widgets[key] = widget_func(
-                        f"{pretty_text.get(name, default_text[name]).get(key, default_text[name][key])}:",
-                        key=f"{config_name}.{name}.{key}",
-                        help=help_text.get(
-                            name, pretty_text.get(name, default_text[name])
-                        ).get(
-                            key,
-                            pretty_text.get(name, default_text[name]).get(
-                                key, default_text[name][key]
-                            ),
-                        ),
-                        **widget_params_default,
+    # Iterate over the numerical parameters
+    for name, values in config["numerical_params"].items():
+        # Resolve the label and help lookups for this group once
+        pretty_name = pretty_text.get(name, default_text[name])
+        help_name = help_text.get(name, pretty_name)
+        title = pretty_name.get("title", default_text[name]["title"])
+
+        # Display the title for the current parameter group
+        st.title(title, help=help_name.get("title", title))
+
+        # Initialize an empty dictionary to store the widgets for the current parameter group
+        params_widgets = {}
+
+        # Iterate over the individual parameters in the current group
+        for key, value in values.items():
+            # Check if the parameter is the "seed" parameter and if it needs to be set to a specific value
+            if (
+                name == "generate_params"
+                and key == "seed"
+                and st.session_state["random_seed"][config_name]
+            ):
+                value_ = st.session_state["all_params"][config_name][
+                    "numerical_params"
+                ]["generate_params"]["seed"]
+            else:
+                # Otherwise, get the default value from the initial parameters
+                value_ = st.session_state["all_params_init"][config_name][
+                    "numerical_params"
+                ][name][key]
+            # Widget key prefix, label and help text for this parameter
+            widget_key = f"{config_name}.{name}.{key}"
+            label = pretty_name.get(key, default_text[name][key])
+            help_label = help_name.get(key, label)
+
+            # Extract the widget type
+            widget_type = value_.get("type", "text_input")
+            # Extract additional widget parameters
+            widget_params = {k: v for k, v in value_.items() if k != "type"}
+
+            # Get the widget function for the parameter type
+            widget_func = getattr(st, widget_type, st.text_input)
+
+            # Filter out any incompatible parameters
+            param_names = get_widget_param_names(widget_type)
+            widget_params = {k: v for k, v in widget_params.items() if k in param_names}
+            # The configured value is a plain value or a dict of per-widget values
+            config_value = widget_params.get("value", {})
+            is_dict_value = isinstance(config_value, dict)
+            # Enhanced widget setup based on parameter type
+            if "step" in param_names and st.session_state["multi_params"][config_name]:
+                # Setup range widgets (from, to, step)
+                from_key = widget_key + ".from"
+                to_key = widget_key + ".to"
+                step_key = widget_key + ".step"
+
+                from_value = config_value
+                if is_dict_value:
+                    from_value = config_value.get("from", "min")
+                widget_params_from = {**widget_params, "value": from_value}
+
+                to_value = config_value
+                if is_dict_value:
+                    to_value = config_value.get("to", "min")
+                widget_params_to = {**widget_params, "value": to_value}
+
+                step_value = widget_params.get("step", 0.0)
+                if is_dict_value:
+                    step_value = config_value.get("step", step_value)
+
+                widget_params_step = {**widget_params, "value": step_value}
+
+                caption_columms = st.columns(1)
+                multi_columms = st.columns(3)
+                with caption_columms[0]:
+                    st.markdown(label, help=help_label)
+                with multi_columms[0]:
+                    from_w = widget_func(
+                        f"From:",
+                        key=from_key,
+                        **widget_params_from,
+                    )
+                with multi_columms[1]:
+                    to_w = widget_func(f"To:", key=to_key, **widget_params_to)
+                with multi_columms[2]:
+                    step_w = widget_func(f"Step:", key=step_key, **widget_params_step)
+
+                params_widgets[key] = {"from": from_w, "to": to_w, "step": step_w}
+            elif (
+                widget_type == "checkbox"
+                and st.session_state["multi_params"][config_name]
+            ):
+                config1_key = widget_key + ".config1"
+                config2_key = widget_key + ".config2"
+
+                config1_value = config_value
+                if is_dict_value:
+                    config1_value = config_value.get("config1", True)
+                widget_params_config1 = {**widget_params, "value": config1_value}
+
+                config2_value = config_value
+                if is_dict_value:
+                    config2_value = config_value.get("config2", False)
+                widget_params_config2 = {**widget_params, "value": config2_value}
+
+                checkbox_columms = st.columns(2)
+                with checkbox_columms[0]:
+                    st.markdown("Config 1:")
+                    config1 = widget_func(
+                        f"{label}:",
+                        key=config1_key,
+                        help=help_label,
+                        **widget_params_config1,
                     )
+                with checkbox_columms[1]:
+                    st.markdown("Config 2:")
+                    config2 = widget_func(
+                        f"{label}:",
+                        key=config2_key,
+                        help=help_label,
+                        **widget_params_config2,
+                    )
+                params_widgets[key] = {
+                    "config1": config1,
+                    "config2": config2,
+                }
+            else:
+                # Default widget setup
+                widget_value = config_value
+                if is_dict_value:
+                    widget_value = config_value.get("from", "min")
+                widget_params_default = {**widget_params, "value": widget_value}
+                params_widgets[key] = widget_func(
+                    f"{label}:",
+                    key=widget_key,
+                    help=help_label,
+                    **widget_params_default,
+                )
 
-            # Store the widgets for the current parameter group in the main widgets dictionary
-            widgets[name] = params_widgets
+        # Store the widgets for the current parameter group in the main widgets dictionary
+        widgets[name] = params_widgets
 
     # Return the dictionary containing all the widgets
     return widgets
 
 
+@fragment
+def render_config_tab(config_name: str) -> None:
+    """
+    Render the parameter widgets and the save form for one configuration tab.
+
+    The function runs as a Streamlit fragment (see ``compat.fragment``), so
+    interacting with a widget in a tab reruns only that tab instead of the whole app.
+    Values are written back to ``st.session_state["all_params"]``, and this
+    configuration's slice of ``st.session_state["slider_params"]`` is refreshed
+    right away.
+
+    Parameters
+    ----------
+    config_name : str
+        Name of the configuration (a key of ``st.session_state["configs"]``).
+
+    Returns
+    -------
+    None
+        This function does not return any value. It renders into the current container.
+    """
+    st.session_state["multi_params"][config_name] = st.checkbox(
+        "Multi Parameters",
+        value=False,
+        key=f"{config_name}.generate_params.multi_params",
+    )
+
+    # If st.session_state["random_seed"] is True
+    if st.session_state["random_seed"][config_name]:
+        # Set a random seed for the "generate_params" in the "numerical_params".
+        # SystemRandom does not share the global `random` state that blocks may reseed.
+        st.session_state["all_params"][config_name]["numerical_params"][
+            "generate_params"
+        ]["seed"]["value"] = random.SystemRandom().randrange(2**32 - 2)
+
+    # ─────────────────────────────────────
+    # ───────── Setup Parameters ──────────
+    # ─────────────────────────────────────
+    # Setup parameters based on user inputs.
+
+    # Call the setup_params function with st.session_state["all_params"] and update the "numerical_params"
+    widgets_vals = setup_params(config_name)
+    for key, val_n in widgets_vals.items():
+        for val in val_n:
+            st.session_state["all_params"][config_name]["numerical_params"][
+                key
+            ][val]["value"] = val_n[val]
+
+    # Refresh this configuration's current values; a tab rerun does not reach the
+    # rebuild at the end of the script
+    st.session_state.setdefault("slider_params", {})[config_name] = {
+        key: {val: param["value"] for val, param in val_n.items()}
+        for key, val_n in st.session_state["all_params"][config_name][
+            "numerical_params"
+        ].items()
+    }
+
+    # ─────────────────────────────────────
+    # ──────── Toggle Random Seed ────────
+    # ─────────────────────────────────────
+    # Toggle the random seed option.
+
+    # Display a checkbox in the tab to toggle "Random seed" with the initial value set to True
+    st.session_state["random_seed"][config_name] = st.checkbox(
+        "Random seed",
+        value=True,
+        key=f"{config_name}.generate_params.random_seed",
+    )
+    # ─────────────────────────────────────
+    # ────── Block for Saving Config ──────
+    # ─────────────────────────────────────
+    st.divider()
+    st.write("## Save Configuration")
+    # Input for specifying the file path where the configuration should be saved
+    save_path = st.text_input(
+        "Save Config Path",
+        value=f"configs/generation/{config_name}.json",
+        key=f"{config_name}.save_config.save_path",
+    )
+    # Button to save the configuration
+    if st.button("Save Config", key=f"{config_name}.save_config.button"):
+        # Only build the configuration to save once the button is clicked
+        slider_params_save = dict()
+        slider_params_save[config_name] = {
+            "numerical_params": {},
+            "text_params": {},
+        }
+        for key, val_n in st.session_state["all_params"][config_name][
+            "numerical_params"
+        ].items():
+            slider_params_save[config_name]["numerical_params"][key] = dict()
+            for val in val_n:
+                slider_params_save[config_name]["numerical_params"][key][
+                    val
+                ] = val_n[val]
+        slider_params_save[config_name]["text_params"] = st.session_state[
+            "all_params"
+        ][config_name]["text_params"]
+        try:
+            # Convert the configuration dictionary to a JSON string
+            config_json = json.dumps(
+                slider_params_save[config_name], indent=4
+            )
+            # Write the JSON string to the specified file path
+            with open(save_path, "w", encoding="UTF-8") as f:
+                f.write(config_json)
+            st.success(f"Configuration saved to {save_path}")
+        except Exception as e:
+            st.error(f"Failed to save configuration: {e}")
+
+
 # ─────────────────────────────────────
 # ────── Block 3: Page Configuration ─
 # ─────────────────────────────────────
@@ -413,13 +520,8 @@ show_pages_from_config()
 # ─────────────────────────────────────
 advanced_sidebar = st.sidebar.expander("Advanced")
 with advanced_sidebar:
-    with open(
-        st.text_input("Main Configuration", value="configs/main.json"),
-        "r",
-        encoding="UTF-8",
-    ) as f:
-        file_content = f.read()
-        main_config = json.loads(file_content)
+    main_config_path = st.text_input("Main Configuration", value="configs/main.json")
+    main_config = load_json(main_config_path, os.path.getmtime(main_config_path))
 
     root_dir_sidepanel = main_config.get("root_dir_sidepanel")
     show_example_block = st.checkbox(
@@ -430,7 +532,7 @@ with advanced_sidebar:
     # ─ Block 5: Check and Load Configs ──
     # ─────────────────────────────────────
     # Get all JSON files in the root_dir directory
-    configs = glob.glob("*.json", root_dir=root_dir_sidepanel)
+    configs = list_files("*.json", root_dir_sidepanel, dir_mtime(root_dir_sidepanel))
 
 
 if len(configs) == 0:
@@ -442,9 +544,11 @@ else:
     # ─────────────────────────────────────
     # Allow user to select a configuration.
 
+    # Configuration names (without .json extension), computed once per rerun
+    config_keys = {i: os.path.splitext(i)[0] for i in configs}
+
     # Create a list of configuration names (without .json extension) in st.session_state["configs"]
-    if "configs_n" not in st.session_state:
-        st.session_state["configs_n"] = {i.split(".")[0]: 1 for i in configs}
+    st.session_state.setdefault("configs_n", {config_keys[i]: 1 for i in configs})
 
     default_config_multiselect = None
 
@@ -455,23 +559,23 @@ else:
             default_config_multiselect = None
 
         for i in configs:
-            if i.split(".")[0] not in st.session_state["configs_n"]:
-                st.session_state["configs_n"][i.split(".")[0]] = 1
+            st.session_state["configs_n"].setdefault(config_keys[i], 1)
 
     with advanced_sidebar:
         add_child_config = st.selectbox(
-            "Add configuration", [i.split(".")[0] for i in configs]
+            "Add configuration", list(config_keys.values())
         )
         add_child_config_button = st.button("Add configuration")
 
     if add_child_config_button:
         st.session_state["configs_n"][add_child_config] += 1
 
-    configs_dict = dict()
-    for config_ in configs:
-        for i in range(st.session_state["configs_n"][config_.split(".")[0]]):
-            configs_dict[f'{config_.split(".")[0]}-{i+1}'] = config_.split(".")[0]
-    st.session_state["configs"] = configs_dict
+    configs_n = st.session_state["configs_n"]
+    st.session_state["configs"] = {
+        f"{config_key}-{i+1}": config_key
+        for config_key in config_keys.values()
+        for i in range(configs_n[config_key])
+    }
 
     # Display a selectbox in the sidebar to choose a configuration from st.session_state["configs"]
     configs_in_run = st.sidebar.multiselect(
@@ -488,24 +592,20 @@ else:
         # Load parameters for the selected configuration.
 
         # If "all_params" doesn't exist in st.session_state or the selected config is different from the previous one
-        if "all_params" not in st.session_state:
-            st.session_state["all_params"] = {}
-            st.session_state["all_params_init"] = {}
+        st.session_state.setdefault("all_params", {})
+        st.session_state.setdefault("all_params_init", {})
         tabs = st.sidebar.tabs(st.session_state["configs_in_run"])
         for config_name, tab in zip(st.session_state["configs_in_run"], tabs):
             if config_name not in st.session_state["all_params"]:
-                with open(
-                    f'{root_dir_sidepanel}/{st.session_state["configs"][config_name]}.json',
-                    "r",
-                    encoding="UTF-8",
-                ) as f:
-                    file_content = f.read()
-                    st.session_state["all_params"][config_name] = json.loads(
-                        file_content
-                    )
-                    st.session_state["all_params_init"][config_name] = json.loads(
-                        file_content
-                    )
+                config_path = f'{root_dir_sidepanel}/{st.session_state["configs"][config_name]}.json'
+                config_mtime = os.path.getmtime(config_path)
+                # Each call returns its own copy, so the two entries never alias
+                st.session_state["all_params"][config_name] = load_json(
+                    config_path, config_mtime
+                )
+                st.session_state["all_params_init"][config_name] = load_json(
+                    config_path, config_mtime
+                )
 
             # ─────────────────────────────────────
             # ────── Initialize Random Seed ───────
@@ -513,113 +613,30 @@ else:
             # Initialize or update random seed.
 
             # Initialize st.session_state["random_seed"] to True if it doesn't exist
-            if "random_seed" not in st.session_state:
-                st.session_state["random_seed"] = dict()
-            if config_name not in st.session_state["random_seed"]:
-                st.session_state["random_seed"][config_name] = True
-
-            if "multi_params" not in st.session_state:
-                st.session_state["multi_params"] = dict()
-            if config_name not in st.session_state["multi_params"]:
-                st.session_state["multi_params"][config_name] = False
-
-            with tab:
-                st.session_state["multi_params"][config_name] = st.checkbox(
-                    "Multi Parameters",
-                    value=False,
-                    key=f"{config_name}.generate_params.multi_params",
-                )
-
-            # If st.session_state["random_seed"] is True
-            if st.session_state["random_seed"][config_name]:
-                # Set a random seed for the "generate_params" in the "numerical_params"
-                st.session_state["all_params"][config_name]["numerical_params"][
-                    "generate_params"
-                ]["seed"]["value"] = np.random.randint(2**32 - 2, dtype=np.int64)
-
-            # ─────────────────────────────────────
-            # ───────── Setup Parameters ──────────
-            # ─────────────────────────────────────
-            # Setup parameters based on user inputs.
-
-            # Call the setup_params function with st.session_state["all_params"] and update the "numerical_params"
-            widgets_vals = setup_params()
-            for key, val_n in widgets_vals.items():
-                for val in val_n:
-                    st.session_state["all_params"][config_name]["numerical_params"][
-                        key
-                    ][val]["value"] = val_n[val]
-
-            # ─────────────────────────────────────
-            # ──────── Toggle Random Seed ────────
-            # ─────────────────────────────────────
-            # Toggle the random seed option.
+            st.session_state.setdefault("random_seed", dict()).setdefault(
+                config_name, True
+            )
+            st.session_state.setdefault("multi_params", dict()).setdefault(
+                config_name, False
+            )
 
-            # Display a checkbox in the sidebar to toggle "Random seed" with the initial value set to True
             with tab:
-                st.session_state["random_seed"][config_name] = st.checkbox(
-                    "Random seed",
-                    value=True,
-                    key=f"{config_name}.generate_params.random_seed",
-                )
-                # ─────────────────────────────────────
-                # ────── Block for Saving Config ──────
-                # ─────────────────────────────────────
-                st.divider()
-                st.write("## Save Configuration")
-                # Input for specifying the file path where the configuration should be saved
-                save_path = st.text_input(
-                    "Save Config Path",
-                    value=f"configs/generation/{config_name}.json",
-                    key=f"{config_name}.save_config.save_path",
-                )
-                slider_params_save = dict()
-                slider_params_save[config_name] = {
-                    "numerical_params": {},
-                    "text_params": {},
-                }
-                for key, val_n in st.session_state["all_params"][config_name][
-                    "numerical_params"
-                ].items():
-                    slider_params_save[config_name]["numerical_params"][key] = dict()
-                    for val in val_n:
-                        slider_params_save[config_name]["numerical_params"][key][
-                            val
-                        ] = val_n[val]
-                slider_params_save[config_name]["text_params"] = st.session_state[
-                    "all_params"
-                ][config_name]["text_params"]
-                # Button to save the configuration
-                if st.button("Save Config", key=f"{config_name}.save_config.button"):
-                    try:
-                        # Convert the configuration dictionary to a JSON string
-                        config_json = json.dumps(
-                            slider_params_save[config_name], indent=4
-                        )
-                        # Write the JSON string to the specified file path
-                        with open(save_path, "w", encoding="UTF-8") as f:
-                            f.write(config_json)
-                        st.success(f"Configuration saved to {save_path}")
-                    except Exception as e:
-                        st.error(f"Failed to save configuration: {e}")
+                render_config_tab(config_name)
 
         # ─────────────────────────────────────
         # ──────── Display Parameters ────────
         # ─────────────────────────────────────
         # Display the parameters for the selected configuration.
 
+        # The tabs keep their own slices current; only drop deselected configurations
+        slider_params = {
+            config_name: st.session_state["slider_params"][config_name]
+            for config_name in st.session_state["configs_in_run"]
+        }
+        st.session_state["slider_params"] = slider_params
+
         # Output the parameters
         with st.expander("Slider Panel Parameters"):
-            slider_params = dict()
-            for config_name in st.session_state["configs_in_run"]:
-                slider_params[config_name] = dict()
-                for key, val_n in st.session_state["all_params"][config_name][
-                    "numerical_params"
-                ].items():
-                    slider_params[config_name][key] = dict()
-                    for val in val_n:
-                        slider_params[config_name][key][val] = val_n[val]["value"]
-                st.session_state["slider_params"] = slider_params
             st.json(slider_params)
     else:
         st.sidebar.warning("No configurations chosen")
@@ -633,16 +650,7 @@ with columns[0]:
 # ─────────────────────────────────────
 # Categorize blocks for display.
 
-category_blocks = {
-    block._state.get("category", "Uncategorized"): [] for block in blocks
-}
-
-if not show_example_block:
-    category_blocks.pop("Examples")
-for block in blocks:
-    category = block._state.get("category", "Uncategorized")
-    if category in category_blocks:
-        category_blocks[category].append(block)
+category_blocks = categorize_blocks(show_example_block)
 
 # ─────────────────────────────────────
 # ───── Block 8: Display Blocks ───────
@@ -1,13 +1,16 @@
 import streamlit as st
 import pandas as pd
+from pandas.util import hash_pandas_object
 from pygwalker.api.streamlit import StreamlitRenderer
 from ydata_profiling import ProfileReport
 import streamlit.components.v1 as components
 import hashlib
 import os
+import shutil
 import json
-import glob
 from st_pages import show_pages_from_config
+from file_cache import load_json, list_files, dir_mtime
+from compat import fragment
 
 # Configure the Streamlit page
 st.set_page_config(
@@ -19,19 +22,17 @@ st.set_page_config(
 
 show_pages_from_config()
 
+
 advanced_sidebar = st.sidebar.expander("Advanced")
 with advanced_sidebar:
-    with open(
-        st.text_input("Main Configuration", value="configs/main.json"),
-        "r",
-        encoding="UTF-8",
-    ) as f:
-        file_content = f.read()
-        main_config = json.loads(file_content)
+    main_config_path = st.text_input("Main Configuration", value="configs/main.json")
+    main_config = load_json(main_config_path, os.path.getmtime(main_config_path))
 
     root_dir_dataframe_hash = main_config.get("root_dir_dataframe_hash")
     root_dir_dataframe_custom = main_config.get("root_dir_dataframe_custom")
-    configs = glob.glob("*.json", root_dir=root_dir_dataframe_custom)
+    configs = list_files(
+        "*.json", root_dir_dataframe_custom, dir_mtime(root_dir_dataframe_custom)
+    )
 
 # Sidebar for DataFrame selection
 st.sidebar.title("DataFrame Selector")
@@ -55,7 +56,13 @@ selected_df_key = st.sidebar.selectbox(
 uploaded_file = st.sidebar.file_uploader("Or upload a new CSV", type=["csv"])
 
 if uploaded_file is not None:
-    df = pd.read_csv(uploaded_file)
+    try:
+        # Multithreaded Arrow parser; much faster on large uploads
+        df = pd.read_csv(uploaded_file, engine="pyarrow")
+    except (ImportError, ValueError):
+        # pyarrow missing or unable to parse this file, use the default parser
+        uploaded_file.seek(0)
+        df = pd.read_csv(uploaded_file)
 else:
     if selected_df_key:
         df = dataframes[selected_df_key]
@@ -74,29 +81,48 @@ custom_config = st.sidebar.selectbox(
 
 # Function to generate hash from DataFrame
 def generate_hash(data):
-    data_string = data.__str__()
-    hasher = hashlib.md5()
-    hasher.update(data_string.encode("utf-8"))  # Encode the string to bytes
+    hasher = hashlib.blake2b(digest_size=16)
+    # Mix in the schema so frames with equal values but different columns differ
+    hasher.update(str(data.shape).encode("utf-8"))
+    hasher.update(",".join(map(str, data.columns)).encode("utf-8"))
+    try:
+        # Vectorized per-row hashes, no string formatting of the whole frame
+        hasher.update(hash_pandas_object(data, index=True).values.tobytes())
+    except TypeError:
+        # Unhashable cells (e.g. lists), fall back to the text representation
+        hasher.update(data.__str__().encode("utf-8"))
     return hasher.hexdigest()
 
 
+# Hash that named spec files before generate_hash switched to content hashing
+def generate_legacy_hash(data):
+    return hashlib.md5(data.__str__().encode("utf-8")).hexdigest()
+
+
+# Path of the spec file stored under the DataFrame's hash
+def hash_config_path(data, hash_name):
+    config_dir = root_dir_dataframe_hash  # Directory to store config files
+    os.makedirs(config_dir, exist_ok=True)
+    config_path = os.path.join(config_dir, f"{hash_name}.json")
+    if not os.path.exists(config_path):
+        # Reuse a spec saved under the legacy name; only runs once per new frame
+        legacy_path = os.path.join(config_dir, f"{generate_legacy_hash(data)}.json")
+        if os.path.exists(legacy_path):
+            shutil.copyfile(legacy_path, config_path)
+    return config_path
+
+
 # Function to load or create configuration
-def load_or_create_config(data, use_custom_config_):
+def load_or_create_config(data, hash_name, use_custom_config_):
     if use_custom_config_:
         try:
             config_dir = root_dir_dataframe_custom
             config_path = os.path.join(config_dir, f"{custom_config}")
         except Exception as e:
             st.sidebar.warning("Could not load configuration, use default")
-            config_dir = root_dir_dataframe_hash  # Directory to store config files
-            os.makedirs(config_dir, exist_ok=True)
-            hash_name = generate_hash(data)
-            config_path = os.path.join(config_dir, f"{hash_name}.json")
+            config_path = hash_config_path(data, hash_name)
     else:
-        config_dir = root_dir_dataframe_hash  # Directory to store config files
-        os.makedirs(config_dir, exist_ok=True)
-        hash_name = generate_hash(data)
-        config_path = os.path.join(config_dir, f"{hash_name}.json")
+        config_path = hash_config_path(data, hash_name)
 
     if not os.path.exists(config_path):
         spec = []
@@ -105,63 +131,86 @@ def load_or_create_config(data, use_custom_config_):
     return config_path
 
 
+# The leading underscore keeps Streamlit from hashing the frame; data_hash is the key
 @st.cache_resource
-def get_renderer(data, use_custom_config_):
-    spec_config = load_or_create_config(data, use_custom_config_)
-    return StreamlitRenderer(data, spec=spec_config, spec_io_mode="rw")
+def get_renderer(_data, data_hash, use_custom_config_):
+    spec_config = load_or_create_config(_data, data_hash, use_custom_config_)
+    return StreamlitRenderer(_data, spec=spec_config, spec_io_mode="rw")
 
 
-st.header("DataFrame")
-with st.expander("DataFrame"):
-    df = st.data_editor(df, use_container_width=True)
+# Same keying as get_renderer; the report HTML is a plain string, so cache_data fits
+@st.cache_data(max_entries=8, show_spinner=False)
+def generate_profile_html(_data, data_hash, **report_params):
+    return ProfileReport(_data, title="Profiling Report", **report_params).to_html()
 
-st.header("Profiling Report")
-profile_columns = st.columns([0.3, 0.7])
 
-profile_button = profile_columns[0].button(
-    "Generate Profiling Report", use_container_width=True
-)
-with profile_columns[1].popover(
-    "Profiling Report Parameters", use_container_width=True
-):
-    columns = st.columns(5)
-    dark_mode = columns[0].checkbox(
-        "Dark Mode", value=True, help="Enable dark mode for profiling report"
-    )
-    explorative = columns[1].checkbox(
-        "Explorative", value=True, help="Explorative mode"
-    )
-    orange_mode = columns[2].checkbox(
-        "Orange Mode", value=True, help="Enable Orange mode for profiling report"
-    )
-    sensitive = columns[3].checkbox(
-        "Sensitive",
-        value=False,
-        help="Hides the values for categorical and text variables for report privacy",
-    )
-    tsmode = columns[4].checkbox(
-        "Time-series analysis",
-        value=False,
-        help="Activates time-series analysis for all the numerical variables from the dataset",
+# Fragments: widgets in one section rerun only that section, not the whole page
+@fragment
+def profile_section(data, data_hash):
+    st.header("Profiling Report")
+    profile_columns = st.columns([0.3, 0.7])
+
+    profile_button = profile_columns[0].button(
+        "Generate Profiling Report", use_container_width=True
     )
+    with profile_columns[1].popover(
+        "Profiling Report Parameters", use_container_width=True
+    ):
+        columns = st.columns(6)
+        dark_mode = columns[0].checkbox(
+            "Dark Mode", value=True, help="Enable dark mode for profiling report"
+        )
+        explorative = columns[1].checkbox(
+            "Explorative", value=True, help="Explorative mode"
+        )
+        orange_mode = columns[2].checkbox(
+            "Orange Mode", value=True, help="Enable Orange mode for profiling report"
+        )
+        sensitive = columns[3].checkbox(
+            "Sensitive",
+            value=False,
+            help="Hides the values for categorical and text variables for report privacy",
+        )
+        tsmode = columns[4].checkbox(
+            "Time-series analysis",
+            value=False,
+            help="Activates time-series analysis for all the numerical variables from the dataset",
+        )
+        minimal = columns[5].checkbox(
+            "Minimal",
+            value=False,
+            help="Skip the expensive computations (correlations, interactions) for a quick look",
+        )
+
+    if profile_button:
+        with st.expander("Profiling Report"):
+            with st.spinner("Generating Profile Report..."):
+                profile = generate_profile_html(
+                    data,
+                    data_hash,
+                    dark_mode=dark_mode,
+                    explorative=explorative,
+                    orange_mode=orange_mode,
+                    sensitive=sensitive,
+                    tsmode=tsmode,
+                    minimal=minimal,
+                )
+            components.html(profile, height=800, scrolling=True)
+
+
+@fragment
+def graphic_walker_section(data, data_hash, use_custom_config_):
+    renderer = get_renderer(data, data_hash, use_custom_config_=use_custom_config_)
+
+    st.header("Graphic Walker")
+    renderer.explorer()
 
-if profile_button:
-    with st.expander("Profiling Report"):
-        with st.spinner("Generating Profile Report..."):
-            profile = ProfileReport(
-                df,
-                title="Profiling Report",
-                dark_mode=dark_mode,
-                explorative=explorative,
-                orange_mode=orange_mode,
-                sensitive=sensitive,
-                tsmode=tsmode,
-            ).to_html()
-        components.html(profile, height=800, scrolling=True)
-
-st.divider()
-renderer = get_renderer(df, use_custom_config_=use_custom_config)
 
+st.header("DataFrame")
+with st.expander("DataFrame"):
+    df = st.data_editor(df, use_container_width=True)
+df_hash = generate_hash(df)
 
-st.header("Graphic Walker")
-renderer.explorer()
+profile_section(df, df_hash)
+st.divider()
+graphic_walker_section(df, df_hash, use_custom_config)
@@ -1,9 +1,12 @@
 import streamlit as st
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from plotly.graph_objects import Figure as Figure_plotly
 from PIL import Image
 import os
+import io
+import hashlib
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import plotly.tools as tls
 import mpld3
 import streamlit.components.v1 as components
@@ -11,46 +14,106 @@ from st_pages import show_pages_from_config
 
 
 def save_fig(fig, name, category):
-    if category not in st.session_state["storage"][Figure.__name__]:
-        st.session_state["storage"][Figure.__name__][category] = dict()
-    st.session_state["storage"][Figure.__name__][category][name] = fig
+    st.session_state["storage"][Figure.__name__].setdefault(category, dict())[name] = fig
+
+
+# Images are only shown in a grid, so they are downscaled to fit this size
+MAX_IMAGE_SIZE = (1024, 1024)
+
+
+# Function to load images; they are displayed as-is, without a matplotlib figure.
+# Identical files share one decoded image, looked up by a digest of their bytes.
+def load_image(image_file, known_images):
+    if hasattr(image_file, "getvalue"):
+        data = image_file.getvalue()
+    else:
+        with open(image_file, "rb") as f:
+            data = f.read()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if digest in known_images:
+        return digest, known_images[digest]
+    image = Image.open(io.BytesIO(data))
+    image.thumbnail(MAX_IMAGE_SIZE)
+    image.load()
+    return digest, image
+
+
+# Digest -> decoded image for this session. Entries whose image is no longer held by
+# storage (replaced or removed) are dropped, so the map never outgrows storage.
+def get_known_images():
+    known_images = st.session_state.setdefault("_image_digests", dict())
+    stored = {
+        id(fig_)
+        for figs in st.session_state["storage"][Figure.__name__].values()
+        if isinstance(figs, dict)
+        for fig_ in figs.values()
+    }
+    for digest in [d for d, image in known_images.items() if id(image) not in stored]:
+        del known_images[digest]
+    return known_images
+
+
+# Conversions are cached per session and keyed weakly on the figure object itself,
+# so an entry goes away with its figure and is never served for a different one
+def convert_figure(fig_, kind, convert):
+    conversions = st.session_state.setdefault(
+        "_figure_conversions", weakref.WeakKeyDictionary()
+    )
+    fig_conversions = conversions.setdefault(fig_, dict())
+    if kind not in fig_conversions:
+        fig_conversions[kind] = convert(fig_)
+    return fig_conversions[kind]
 
 
-# Function to load images and convert them to matplotlib figures
-def image_to_figure(image_file):
-    image = Image.open(image_file)
-    fig, ax = plt.subplots()
-    ax.imshow(image)
-    ax.axis("off")
-    return fig
+def mpl2plotly(fig_):
+    return convert_figure(fig_, "plotly", tls.mpl_to_plotly)
 
 
-def mpl2plotly(fig_):
-    plotly_fig = tls.mpl_to_plotly(fig_)
-    return plotly_fig
+def mpl2html(fig_):
+    return convert_figure(fig_, "html", mpld3.fig_to_html)
 
 
 # Function to load plots from a folder with progress bar
 def load_plots_from_folder(folder_path):
-    files = os.listdir(folder_path)
-    total_files = len(files)
+    loaded = st.session_state["storage"][Figure.__name__].get("folder", {})
+    known_images = get_known_images()
+    with os.scandir(folder_path) as it:
+        entries = [e for e in it if e.is_file() and e.name not in loaded]
+    total_files = len(entries)
     progress_bar = st.progress(0)
 
-    for index, filename in enumerate(files):
-        if filename not in st.session_state["storage"]["folder"][Figure.__name__]:
-            file_path = os.path.join(folder_path, filename)
+    # Decoding releases the GIL, so images are loaded in parallel threads; Streamlit
+    # calls stay on this thread
+    with ThreadPoolExecutor() as executor:
+        futures = {
+            executor.submit(load_image, e.path, known_images): e.name for e in entries
+        }
+        for index, future in enumerate(as_completed(futures)):
+            filename = futures[future]
             try:
-                fig = image_to_figure(file_path)
-                save_fig(fig, filename, "folder")
+                digest, image = future.result()
+                # Identical files decoded in the same batch collapse to one image here
+                image = known_images.setdefault(digest, image)
+                save_fig(image, filename, "folder")
             except Exception as e:
                 st.warning(f"Could not load file {filename}: {e}")
             progress_bar.progress((index + 1) / total_files, text=filename)
-    progress_bar.progress((index + 1) / total_files, text="Completed")
+    progress_bar.progress(1.0, text="Completed")
     st.success("Loading complete!")
 
 
+# Approximate number of SVG elements mpld3 would emit for a figure
+def count_elements(fig_):
+    count = 0
+    for ax in fig_.axes:
+        # Each point of a scatter-like collection becomes its own SVG node
+        count += sum(max(len(c.get_offsets()), 1) for c in ax.collections)
+        count += len(ax.lines) + len(ax.patches)
+    return count
+
+
 # Function to display figures in a dynamically scaled grid
-def display_figures_in_grid(figures, columns=3):
+def display_figures_in_grid(figures, columns=3, max_svg_elements=2000):
     keys = list(figures.keys())
     cols = st.columns(columns)
 
@@ -58,6 +121,10 @@ def display_figures_in_grid(figures, columns=3):
         col = cols[idx % columns]
         with col:
             st.subheader(key)
+            if isinstance(figures[key], Image.Image):
+                # Send the pixels directly instead of rendering them through a plot
+                st.image(figures[key])
+                continue
             if isinstance(figures[key], Figure):
                 matplotlib_plot = figures[key]
                 try:
@@ -83,11 +150,17 @@ def display_figures_in_grid(figures, columns=3):
                     st.pyplot(matplotlib_plot)
 
             elif st.session_state["display_mode"] == "interactive_matplotlib":
-                if matplotlib_plot is not None:
-                    fig_html = mpld3.fig_to_html(matplotlib_plot)
+                # mpld3 renders to SVG, which gets slow on dense figures
+                if (
+                    matplotlib_plot is not None
+                    and count_elements(matplotlib_plot) <= max_svg_elements
+                ):
+                    fig_html = mpl2html(matplotlib_plot)
                     components.html(fig_html, height=500)
-                else:
+                elif plotly_plot is not None:
                     st.plotly_chart(plotly_plot, use_container_width=True)
+                else:
+                    st.pyplot(matplotlib_plot)
 
 
 # Initialize session state for storage and display mode
@@ -118,22 +191,23 @@ if folder_path:
 uploaded_files = st.sidebar.file_uploader("Upload Plots", accept_multiple_files=True)
 
 if uploaded_files:
+    known_images = get_known_images()
     for uploaded_file in uploaded_files:
         try:
-            fig = image_to_figure(uploaded_file)
-            save_fig(fig, uploaded_file.name, "uploaded")
+            digest, image = load_image(uploaded_file, known_images)
+            image = known_images.setdefault(digest, image)
+            save_fig(image, uploaded_file.name, "uploaded")
         except Exception as e:
             st.warning(f"Could not load file {uploaded_file.name}: {e}")
 
 # Retrieve saved figures
-storage_figs = st.session_state["storage"].get(Figure.__name__)
+figs_root = st.session_state["storage"][Figure.__name__]
+# Top-level figures only; "uploaded" and "folder" are sub-dicts handled below
 storage_figs = {
-    k: v
-    for k, v in storage_figs.items()
-    if any([isinstance(v, Figure), isinstance(v, Figure_plotly)])
+    k: v for k, v in figs_root.items() if isinstance(v, (Figure, Figure_plotly))
 }
-uploaded_figs = st.session_state["storage"].get(Figure.__name__, {}).get("uploaded", {})
-folder_figs = st.session_state["storage"].get(Figure.__name__, {}).get("folder", {})
+uploaded_figs = figs_root.get("uploaded", {})
+folder_figs = figs_root.get("folder", {})
 
 # Dropdown to select and display figures
 st.sidebar.header("Select Figures to Display")
@@ -161,7 +235,16 @@ display_mode = st.sidebar.radio(
     ["Matplotlib", "Plotly", "Interactive Matplotlib"],
 )
 st.session_state["display_mode"] = display_mode.lower().replace(" ", "_")
+max_svg_elements = st.sidebar.slider(
+    "Max elements for Interactive Matplotlib",
+    min_value=100,
+    max_value=20000,
+    value=2000,
+    step=100,
+    help="Denser figures are shown with Plotly instead of mpld3",
+    disabled=st.session_state["display_mode"] != "interactive_matplotlib",
+)
 
 columns = st.slider("Number of columns", min_value=1, max_value=8, value=2, step=1)
 # Display the selected figures in a dynamically scaled grid
-display_figures_in_grid(selected_figs, columns)
+display_figures_in_grid(selected_figs, columns, max_svg_elements)
@@ -1,8 +1,9 @@
 import streamlit as st
 from streamlit_ace import st_ace, THEMES, KEYBINDINGS
-import json
-import glob
+import os
+import hashlib
 from st_pages import show_pages_from_config
+from file_cache import load_json, list_files, dir_mtime
 
 if "storage" not in st.session_state:
     st.session_state["storage"] = dict()
@@ -16,18 +17,20 @@ st.set_page_config(
 
 show_pages_from_config()
 
+
+# Compile each distinct script once instead of on every rerun
+@st.cache_resource(max_entries=32, show_spinner=False)
+def compile_code(code):
+    return compile(code, "<editor>", "exec")
+
+
 advanced_sidebar = st.sidebar.expander("Advanced")
 with advanced_sidebar:
-    with open(
-        st.text_input("Main Configuration", value="configs/main.json"),
-        "r",
-        encoding="UTF-8",
-    ) as f:
-        file_content = f.read()
-        main_config = json.loads(file_content)
-        python_editor_params = main_config.get("python_editor", {})
-        root_dir_py_scripts = main_config.get("root_dir_py_scripts", "scripts")
-        scripts = glob.glob("*.py", root_dir=root_dir_py_scripts)
+    main_config_path = st.text_input("Main Configuration", value="configs/main.json")
+    main_config = load_json(main_config_path, os.path.getmtime(main_config_path))
+    python_editor_params = main_config.get("python_editor", {})
+    root_dir_py_scripts = main_config.get("root_dir_py_scripts", "scripts")
+    scripts = list_files("*.py", root_dir_py_scripts, dir_mtime(root_dir_py_scripts))
 
 
 editor, app, storage_tab = st.tabs(["Editor", "App", "Storage :briefcase:"])
@@ -40,9 +43,13 @@ folder_script = st.sidebar.selectbox(
 )
 if uploaded_script:
     script_in_use = uploaded_script.getvalue().decode("utf-8")
+    script_src_id = uploaded_script.name
 else:
     with open(f"{root_dir_py_scripts}{folder_script}", "r", encoding="UTF-8") as f:
         script_in_use = f.read()
+    script_src_id = folder_script
+# Short, stable editor key: changes only when another script (or new content) is loaded
+script_digest = hashlib.blake2b(script_in_use.encode("utf-8"), digest_size=8).hexdigest()
 
 with editor:
     code = st_ace(
@@ -81,7 +88,7 @@ with editor:
         readonly=python_editor_params_panel.checkbox(
             "Readonly", value=python_editor_params.get("readonly", False)
         ),
-        key=f"ace-editor-{script_in_use}",
+        key=f"ace-editor-{script_src_id}-{script_digest}",
     )
     st.write("Hit `CTRL+ENTER` to refresh")
     st.write("*Remember to save your code separately!*")
@@ -109,7 +116,7 @@ if st.sidebar.button(
 
 with app:
     storage = dict(st.session_state["storage"])
-    exec(code)
+    exec(compile_code(code))
 
 with storage_tab:
     st.write(st.session_state["storage"])